@@ -1,10 +1,11 @@
-from .base import BaseConfig
+from .base import BaseConfig, BaseConfigSlotted
 from .fields import Var
 from .exceptions import EnvifrogError, MissingVariableError, ValidationError, TypeCastingError, FrozenInstanceError
 from .utils import setup_logging_redactor
 
 __all__ = [
     "BaseConfig",
+    "BaseConfigSlotted",
     "Var",
     "EnvifrogError",
     "MissingVariableError",
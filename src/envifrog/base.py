@@ -1,19 +1,324 @@
 import os
-import time
-import inspect
+import sys
+import copy
+import types
 import threading
 import pathlib
-from typing import Any, Dict, List, Union, Callable, get_type_hints, Optional
+from collections import ChainMap
+from typing import Annotated, Any, Dict, ForwardRef, List, Mapping, NamedTuple, Union, Callable, get_origin, get_type_hints, Optional
 from .fields import Var
 from .exceptions import MissingVariableError, ValidationError, TypeCastingError, FrozenInstanceError
-from .utils import load_config_file, cast_value
+from .utils import _MISSING, load_config_file_cached, compile_caster
+from .watcher import (AsyncFileWatcher, InotifyFileWatcher, StopEvent, group_by_directory,
+                      has_event_backend, has_inotify, scan_stamps)
+
+# Resolved type hints are stored on each config class under this name.
+# Annotations are fixed once a class is defined, so resolving them on every
+# instantiation/reload is wasted work.
+_HINTS_ATTR = '__envifrog_hints__'
+
+
+def _is_resolved(hint: Any) -> bool:
+    """
+    True if a hint is used as-is by `get_type_hints`: no string/forward
+    references left to evaluate, and no `Annotated` metadata to strip.
+    """
+    if isinstance(hint, (str, ForwardRef)) or get_origin(hint) is Annotated:
+        return False
+    return all(_is_resolved(arg) for arg in getattr(hint, '__args__', ()))
+
+
+def _fast_hints(cls: type) -> Optional[Dict[str, Any]]:
+    """
+    Merge the annotations of the MRO without `get_type_hints`.
+
+    Returns None if any annotation still needs evaluation (e.g. string
+    annotations or `from __future__ import annotations`) or rewriting
+    (`Annotated`), which is then left to `get_type_hints`.
+    """
+    hints: Dict[str, Any] = {}
+    for klass in reversed(cls.__mro__[:-1]):
+        for name, hint in vars(klass).get('__annotations__', {}).items():
+            if hint is None:
+                hint = type(None)
+            elif not _is_resolved(hint):
+                return None
+            hints[name] = hint
+    return hints
+
+
+def _cached_hints(cls: type) -> Dict[str, Any]:
+    """Return the (cached) type hints of a config class."""
+    # Looked up in the class's own namespace: a subclass must not reuse
+    # the hints of its parent.
+    cached = vars(cls).get(_HINTS_ATTR)
+    if cached is not None:
+        return cached
+    hints = _fast_hints(cls)
+    if hints is None:
+        try:
+            hints = get_type_hints(cls)
+        except Exception:
+            hints = cls.__annotations__
+    setattr(cls, _HINTS_ATTR, hints)
+    return hints
+
+
+# Values of these types (from JSON/TOML files) are used as-is instead of being cast.
+_PASSTHROUGH_TYPES = (dict, list, int, float, bool)
+
+def _compile_caster(field_type: Any) -> Callable[[Any], Any]:
+    """Build the function converting a raw loaded value to `field_type`."""
+    cast = compile_caster(field_type)
+
+    def caster(raw: Any) -> Any:
+        if isinstance(raw, str):
+            return cast(raw)
+        # If already correct type (from JSON/TOML), skip string casting
+        if isinstance(raw, _PASSTHROUGH_TYPES):
+            # Containers come from the shared parse cache: each instance gets
+            # its own copy, so mutating it cannot leak into later loads.
+            if isinstance(raw, (dict, list)):
+                return copy.deepcopy(raw)
+            return raw
+        return cast(str(raw))
+
+    return caster
+
+
+def _compile_validator(field_name: str, var_config: Var) -> Optional[Callable[[Any], None]]:
+    """Build the function validating a field's value, or None if it has no constraints."""
+    choices = var_config.choices
+    min_val = var_config.min_val
+    max_val = var_config.max_val
+    validator = var_config.validator
+
+    if choices is None and min_val is None and max_val is None and not validator:
+        return None
+
+    def validate(value: Any) -> None:
+        if choices is not None:
+            if value not in choices:
+                raise ValidationError(f"Value {value} for {field_name} not in {choices}")
+
+        if isinstance(value, (int, float)):
+            if min_val is not None and value < min_val:
+                raise ValidationError(f"{field_name} ({value}) < min_val {min_val}")
+            if max_val is not None and value > max_val:
+                raise ValidationError(f"{field_name} ({value}) > max_val {max_val}")
+
+        if validator:
+            if not validator(value):
+                raise ValidationError(f"Custom validation failed for {field_name}")
+
+    return validate
+
+
+class FieldPlan(NamedTuple):
+    """
+    Pre-computed, class-level metadata for a single configuration field.
+
+    Everything here depends only on the class definition, so it is derived
+    once per class and replayed by every instance (and every reload).
+    """
+    name: str
+    full_name_suffix: str
+    default: Any
+    is_required: bool
+    caster: Callable[[Any], Any]
+    is_nested: bool
+    nested_cls: Optional[type]
+    nested_prefix: str
+    validate: Optional[Callable[[Any], None]]
+    secret: bool
+
+
+def _field_var(cls: type, name: str) -> Var:
+    """Return the `Var` declared for a field, wrapping plain defaults."""
+    defaults = getattr(cls, '__envifrog_defaults__', None)
+    if defaults is not None and name in defaults:
+        field_val = defaults[name]
+    else:
+        field_val = getattr(cls, name, _MISSING)
+    # On slotted classes a field without default resolves to its slot descriptor
+    if field_val is _MISSING or isinstance(field_val, types.MemberDescriptorType):
+        return Var(default=...)
+    if not isinstance(field_val, Var):
+        field_val = Var(default=field_val)
+    return field_val
+
+
+def _field_plan(cls: type) -> List[FieldPlan]:
+    """Return the (cached) field plan of a config class."""
+    # Stored on the class itself (like the hints), so it goes away with it
+    cached = vars(cls).get('__envifrog_plan__')
+    if cached is not None:
+        return cached
+
+    plan = []
+    for field_name, field_type in _cached_hints(cls).items():
+        if field_name.startswith('_'):
+            continue
+
+        var_config = _field_var(cls, field_name)
+
+        prefix = var_config.prefix or ""
+
+        # Unwrap Optional/Union for nested config check
+        target_cls = field_type
+        if getattr(field_type, '__origin__', None):
+            non_none = [a for a in getattr(field_type, '__args__', ()) if a is not type(None)]
+            if non_none:
+                target_cls = non_none[0]
+        is_nested = isinstance(target_cls, type) and issubclass(target_cls, BaseConfig)
+
+        plan.append(FieldPlan(
+            name=sys.intern(field_name),
+            full_name_suffix=sys.intern(prefix + field_name),
+            default=var_config.default,
+            is_required=var_config.default is ...,
+            caster=_compile_caster(field_type),
+            is_nested=is_nested,
+            nested_cls=target_cls if is_nested else None,
+            nested_prefix=sys.intern(prefix),
+            validate=_compile_validator(field_name, var_config),
+            secret=var_config.secret,
+        ))
+
+    cls.__envifrog_plan__ = plan
+    return plan
+
+
+def _compile_apply(cls: type) -> Callable[[Any, Mapping[str, Any]], Dict[str, Any]]:
+    """
+    Generate a function resolving every field of `cls` in one straight pass.
+
+    The plan is unrolled into Python source (one block per field, casters,
+    validators and defaults bound as globals of the generated code), then
+    exec'd once per class, the way dataclasses generates `__init__`. It
+    returns the field values. For slotted classes it also stores them, with
+    direct slot descriptor writes once every field has resolved.
+    """
+    cached = vars(cls).get('__envifrog_apply__')
+    if cached is not None:
+        return cached
+
+    ns: Dict[str, Any] = {
+        'MissingVariableError': MissingVariableError,
+        'TypeCastingError': TypeCastingError,
+    }
+    lines = [
+        "def apply(self, env):",
+        "    prefix = self._prefix",
+        "    get = env.get",
+        "    values = {}",
+    ]
+    for i, plan in enumerate(_field_plan(cls)):
+        field = repr(plan.name)
+        if plan.is_nested:
+            ns[f'nested_{i}'] = plan.nested_cls
+            lines.append(
+                f"    values[{field}] = nested_{i}(env_path=self._loaded_files, "
+                f"_prefix=prefix + {plan.nested_prefix!r}, _env_vars=env)"
+            )
+            continue
+
+        suffix = repr(plan.full_name_suffix)
+        ns[f'cast_{i}'] = plan.caster
+        lines += [
+            f"    name = prefix + {suffix} if prefix else {suffix}",
+            "    raw = get(name)",
+            "    if raw is None:",
+        ]
+        if plan.is_required:
+            lines.append('        raise MissingVariableError(f"Missing required variable: {name}")')
+        else:
+            ns[f'default_{i}'] = plan.default
+            lines.append(f"        value = default_{i}")
+        lines += [
+            "    else:",
+            "        try:",
+            f"            value = cast_{i}(raw)",
+            "        except TypeCastingError as e:",
+            '            raise TypeCastingError(f"Error casting {name}: {e}") from e',
+        ]
+        if plan.validate is not None:
+            ns[f'validate_{i}'] = plan.validate
+            lines.append(f"    validate_{i}(value)")
+        lines.append(f"    values[{field}] = value")
+
+    if cls._slotted:
+        ns['object_setattr'] = object.__setattr__
+        for i, plan in enumerate(_field_plan(cls)):
+            slot = getattr(cls, plan.name, None)
+            if isinstance(slot, types.MemberDescriptorType):
+                ns[f'set_{i}'] = slot.__set__
+                lines.append(f"    set_{i}(self, values[{plan.name!r}])")
+            else:
+                # Inherited from a non-slotted base or mixin: lives in __dict__
+                lines.append(f"    object_setattr(self, {plan.name!r}, values[{plan.name!r}])")
+    lines.append("    return values")
+
+    exec("\n".join(lines), ns)
+    apply = ns['apply']
+    apply.__qualname__ = f"{cls.__qualname__}.__envifrog_apply__"
+    cls.__envifrog_apply__ = apply
+    return apply
+
+
+def _properties_of(cls: type) -> tuple:
+    """Return the (cached) names of the properties defined on a config class."""
+    cached = vars(cls).get('__envifrog_props__')
+    if cached is not None:
+        return cached
+
+    seen = set()
+    names = []
+    for klass in cls.__mro__:
+        for name, member in vars(klass).items():
+            if name in seen:
+                continue
+            seen.add(name)
+            if isinstance(member, property):
+                names.append(name)
+
+    props = tuple(sorted(names))
+    cls.__envifrog_props__ = props
+    return props
+
 
 class BaseConfig:
     """
     Base configuration class with immutability, profiles, and live reloading.
     """
+
+    # Internal state lives in slots. Plain subclasses still get a __dict__
+    # for their fields; BaseConfigSlotted ones get no __dict__ at all.
+    __slots__ = ('_frozen', '_prefix', '_loaded_files', '_watcher_thread',
+                 '_stop_watching', '_secrets', '_field_names', '_env_vars', '_env_override',
+                 '_env_snapshot')
+
+    # Whether fields are stored in __slots__ (see BaseConfigSlotted)
+    _slotted = False
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Specialize the casters and generate the field resolution code at
+        # class definition when the annotations are already resolved. Forward
+        # references are left to the first instance, as the classes they name
+        # may not exist yet.
+        if _fast_hints(cls) is not None:
+            try:
+                _compile_apply(cls)
+            except (NameError, TypeError):
+                # Hints that cannot be specialized yet (e.g. a generic alias
+                # naming a class defined later); retried on first instance.
+                if '__envifrog_plan__' in vars(cls):
+                    del cls.__envifrog_plan__
     
-    def __init__(self, env_path: Union[str, List[str], None] = None, _prefix: str = ""):
+    def __init__(self, env_path: Union[str, List[str], None] = None, _prefix: str = "",
+                 _env_vars: Optional[Mapping[str, Any]] = None, *,
+                 env_override: Optional[Mapping[str, Any]] = None):
         """
         Initialize the configuration.
         
@@ -21,24 +326,37 @@ class BaseConfig:
             env_path: Path(s) to configuration file(s). Can be a string or list of strings.
                       If None, tries to detect using ENVIFROG_MODE (e.g., 'dev' -> .env.dev).
             _prefix: Internal use only. Prefix to apply to environment variables.
+            _env_vars: Internal use only. Already merged variables (passed down to
+                       nested configs so files are not re-read and re-parsed).
+            env_override: Keyword-only. Variables taking precedence over both the
+                          environment and the files, without modifying `os.environ`
+                          (e.g. in tests).
         """
         # Internal flags
         self._frozen = False
-        self._prefix = _prefix
+        self._prefix = sys.intern(_prefix)
         self._loaded_files: List[str] = []
-        self._watcher_thread: Optional[threading.Thread] = None
-        self._stop_watching = threading.Event()
-        self._secrets: set = set()
+        self._watcher_thread: Optional[Any] = None  # Thread, or a WatchHub handle
+        self._stop_watching = StopEvent()
+        self._secrets: frozenset = frozenset()
+        self._field_names: tuple = ()
+        self._env_override = env_override
 
         # 1. Resolve paths
         paths = self._resolve_paths(env_path)
         self._loaded_files = paths # Store for watcher
         
-        # 2. Load variables
-        self._env_vars = self._load_and_merge(paths)
+        # 2. Load variables (nested configs reuse their parent's)
+        is_root = _env_vars is None
+        if is_root:
+            _env_vars = self._load_and_merge(paths)
+        self._env_vars = _env_vars
         
         # 3. Apply Fields
         self._apply_fields()
+        # Values the fields were built from, compared on reload (the
+        # top-level config reloads its nested ones)
+        self._env_snapshot = self._snapshot(_env_vars) if is_root else None
         
         # 4. Post-init hook
         if hasattr(self, 'hook'):
@@ -61,128 +379,124 @@ class BaseConfig:
         
         return env_path
 
-    def _load_and_merge(self, paths: List[str]) -> Dict[str, Any]:
-        combined_vars = {}
-        
-        # Merge files in order
-        for path in paths:
-            if os.path.exists(path) and os.path.isfile(path):
-                file_vars = load_config_file(path)
-                combined_vars.update(file_vars)
+    def _load_and_merge(self, paths: List[str]) -> ChainMap:
+        # Missing files and directories load as {}, from the single stat
+        # the parse cache makes anyway.
+        loaded = [d for d in map(load_config_file_cached, paths) if d]
+
+        if len(loaded) == 1:
+            # The usual single file: chain the cached dict itself. It is only
+            # ever read (ChainMap writes would go to os.environ).
+            file_vars = loaded[0]
+        else:
+            # Merge files in order into one dict
+            file_vars = {}
+            for data in loaded:
+                file_vars.update(data)
         
-        # System env vars have highest priority
-        combined_vars.update(os.environ)
-        return combined_vars
+        # System env vars have highest priority (after explicit overrides).
+        # Chained rather than copied, as only a handful of keys are ever
+        # looked up. The files always stay the last map.
+        if self._env_override:
+            return ChainMap(self._env_override, os.environ, file_vars)
+        return ChainMap(os.environ, file_vars)
+
+    def _apply_fields(self, changed_keys: Optional[set] = None):
+        """
+        Resolve, cast and validate fields from `self._env_vars`.
 
-    def _apply_fields(self):
+        If `changed_keys` is given (on reload), only fields reading one of
+        those variables are processed again.
+        """
         cls = self.__class__
-        try:
-            hints = get_type_hints(cls)
-        except Exception:
-            hints = cls.__annotations__
+        plans = _field_plan(cls)
+        # Assign everything at once (bypassing __setattr__), so a failing
+        # field leaves previously applied values untouched.
+        if changed_keys is None:
+            values = _compile_apply(cls)(self, self._env_vars)
+            if not cls._slotted:  # slots are filled by the generated code
+                self.__dict__.update(values)
+        else:
+            values = self._changed_values(plans, changed_keys)
+            if cls._slotted:
+                for field_name, value in values.items():
+                    object.__setattr__(self, field_name, value)
+            else:
+                self.__dict__.update(values)
+
+        self._field_names = tuple(plan.name for plan in plans)
+        self._secrets = frozenset(plan.name for plan in plans if plan.secret and not plan.is_nested)
+
+    def _changed_values(self, plans: List[FieldPlan], changed_keys: set) -> Dict[str, Any]:
+        """Resolve the fields affected by `changed_keys`, following the plan."""
+        values: Dict[str, Any] = {}
+        for plan in plans:
+            field_name = plan.name
+            full_var_name = self._prefix + plan.full_name_suffix if self._prefix else plan.full_name_suffix
 
-        for field_name, field_type in hints.items():
-            if field_name.startswith('_'):
+            if plan.is_nested:
+                affected = not changed_keys.isdisjoint(getattr(self, field_name)._source_keys())
+            else:
+                affected = full_var_name in changed_keys
+            if not affected:
                 continue
-                
-            # Get annotations and Var
-            field_val = getattr(cls, field_name, Var(default=...))
-            if not isinstance(field_val, Var):
-                field_val = Var(default=field_val)
-                
-            var_config: Var = field_val
-            
-            # Helper for full name logic (simplistic trace)
-            full_var_name = self._prefix + var_config.prefix + field_name if var_config.prefix else self._prefix + field_name
-            
-            # Check for Nested Config
-            origin = getattr(field_type, '__origin__', None)
-            args = getattr(field_type, '__args__', [])
-            target_cls = field_type
-            
-            # Unwrap Optional/Union for nested config check
-            if origin:
-                non_none = [a for a in args if a is not type(None)]
-                if non_none:
-                    target_cls = non_none[0]
-
-            if isinstance(target_cls, type) and issubclass(target_cls, BaseConfig):
-                # Nested Config
-                # We pass the same 'env_path' to nested configs usually, 
-                # OR we rely on the fact that we already loaded vars?
-                # Actually, nested configs should just effectively assert structure on the SAME loaded vars.
-                # But BaseConfig init re-loads files. 
-                # Optimization: In a real expanded version, we might pass the already loaded dict.
-                # For now, adhering to instructions, we just instantiate.
-                # However, to support profiles, we must pass the same logic.
-                # But we don't have the original `env_path` argument stored cleanly as passed.
-                # We interpret `self._loaded_files` which works.
-                nested_instance = target_cls(env_path=self._loaded_files, _prefix=full_var_name[:-len(field_name)]) # Wait, logic for prefix is tricky if nested. 
-                # Let's fix prefix logic. 
-                # Current prefix: self._prefix
-                # Var prefix: var_config.prefix
-                # Combined: self._prefix + (var_config.prefix or "")
-                # The nested class will append its own fields.
-                # So we pass `_prefix = self._prefix + (var_config.prefix or "")`
-                # But we constructed `full_var_name` using `field_name`. Nested config shouldn't use `field_name` as prefix unless implicit.
-                # Usually nested config `DB` with `DB_` prefix implies `DB.HOST` -> `DB_HOST`.
-                # If `var_config.prefix` is set to "DB_", then we pass "DB_".
-                # If not set, maybe it defaults to name? No, usually explicit.
-                nested_prefix = self._prefix + (var_config.prefix if var_config.prefix else "")
-                
-                # Check if we should override the value directly from var_config.default?
-                # Only if it's not a Var but a class? No.
-                
-                nested_instance = target_cls(env_path=self._loaded_files, _prefix=nested_prefix)
-                object.__setattr__(self, field_name, nested_instance)
+
+            if plan.is_nested:
+                # Nested configs share the loaded files; the nested class
+                # appends its own field names to the combined prefix.
+                nested_instance = plan.nested_cls(
+                    env_path=self._loaded_files,
+                    _prefix=self._prefix + plan.nested_prefix,
+                    _env_vars=self._env_vars,
+                )
+                values[field_name] = nested_instance
                 continue
 
             # Resolving Value
             raw_value = self._env_vars.get(full_var_name)
-            final_value = None
             
             if raw_value is None:
-                if var_config.default is ...:
+                if plan.is_required:
                     raise MissingVariableError(f"Missing required variable: {full_var_name}")
-                final_value = var_config.default
+                final_value = plan.default
             else:
-                # Cast
                 try:
-                    # If already correct type (from JSON/TOML), skip string casting if possible
-                    if isinstance(raw_value, (dict, list, int, float, bool)) and not isinstance(raw_value, str):
-                        # Attempt to use as is, maybe validate type compatibility?
-                        final_value = raw_value
-                    else:
-                        final_value = cast_value(str(raw_value), field_type)
+                    final_value = plan.caster(raw_value)
                 except TypeCastingError as e:
                      raise TypeCastingError(f"Error casting {full_var_name}: {e}") from e
 
             # Validation
-            if var_config.choices is not None:
-                if final_value not in var_config.choices:
-                    raise ValidationError(f"Value {final_value} for {field_name} not in {var_config.choices}")
-
-            if isinstance(final_value, (int, float)):
-                if var_config.min_val is not None and final_value < var_config.min_val:
-                    raise ValidationError(f"{field_name} ({final_value}) < min_val {var_config.min_val}")
-                if var_config.max_val is not None and final_value > var_config.max_val:
-                    raise ValidationError(f"{field_name} ({final_value}) > max_val {var_config.max_val}")
-
-            if var_config.validator:
-                if not var_config.validator(final_value):
-                    raise ValidationError(f"Custom validation failed for {field_name}")
-
-            # Set attribute (bypass __setattr__ since we are in init, but purely relying on _frozen flag is better)
-            # Since _frozen is False, direct setattr works if we implemented __setattr__ correctly.
-            object.__setattr__(self, field_name, final_value)
-            
-            if var_config.secret:
-                self._secrets.add(field_name)
+            if plan.validate is not None:
+                plan.validate(final_value)
+
+            values[field_name] = final_value
+
+        return values
+
+    def _source_keys(self) -> set:
+        """Names of the variables read by this config and its nested configs."""
+        keys = set()
+        for plan in _field_plan(self.__class__):
+            if plan.is_nested:
+                keys |= getattr(self, plan.name)._source_keys()
+            else:
+                keys.add(self._prefix + plan.full_name_suffix)
+        return keys
+
+    def _snapshot(self, env: Mapping[str, Any]) -> Dict[str, Any]:
+        """Current values of the variables read by this config (and nested ones)."""
+        get = env.get
+        return {key: get(key) for key in self._source_keys()}
 
     def __setattr__(self, name: str, value: Any) -> None:
-        if getattr(self, '_frozen', False) and not name.startswith('_'):
-             raise FrozenInstanceError(f"Configuration is immutable. Cannot modify '{name}'.")
-        super().__setattr__(name, value)
+        if name[:1] != '_':
+            try:
+                frozen = self._frozen
+            except AttributeError:  # slot not set yet: before __init__, or copy()
+                frozen = False
+            if frozen:
+                raise FrozenInstanceError(f"Configuration is immutable. Cannot modify '{name}'.")
+        object.__setattr__(self, name, value)
 
     def hook(self):
         """Override for cross-field validation."""
@@ -194,99 +508,174 @@ class BaseConfig:
         
         # 1. Properties
         if show_computed:
-            for name, _ in inspect.getmembers(cls, lambda o: isinstance(o, property)):
+            for name in _properties_of(cls):
                 # We need to get the value from the instance
                 val = getattr(self, name)
                 result[name] = val
                 
         # 2. Fields
-        keys = [k for k in dir(self) if not k.startswith('_') and k != 'to_dict' and k != 'hook' and k != 'watch' and k != 'generate_markdown_docs']
-        
-        for key in keys:
-             val = getattr(self, key)
-             if callable(val): continue
-             
-             if isinstance(val, BaseConfig):
-                 result[key] = val.to_dict(show_secrets, show_computed)
-                 continue
-                 
-             is_secret = key in self._secrets
-             if is_secret and not show_secrets:
-                 result[key] = "********"
-             else:
-                 result[key] = val
+        def dump(val: Any) -> Any:
+            if isinstance(val, BaseConfig):
+                return val.to_dict(show_secrets, show_computed)
+            return val
+
+        secrets = self._secrets
+        if secrets and not show_secrets:
+            result.update({
+                key: "********" if key in secrets else dump(getattr(self, key))
+                for key in self._field_names
+            })
+        else:
+            result.update({key: dump(getattr(self, key)) for key in self._field_names})
         return result
 
-    def watch(self, callback: Callable[['BaseConfig'], None]) -> None:
+    def watch(self, callback: Callable[['BaseConfig'], None], polling: bool = False,
+              debounce: float = 0.1) -> threading.Event:
         """
         Start a background thread to watch for changes in configuration files.
+
+        Uses file system events (native inotify on Linux, or the optional `watchdog`
+        package elsewhere), otherwise (or if `polling=True`) falls back to polling
+        file mtimes every second. With events, changes less than `debounce` seconds
+        apart trigger a single reload.
+
+        Returns an event that is set once the watcher is in place: changes made
+        after it is set are guaranteed to be picked up.
         """
-        if self._watcher_thread and self._watcher_thread.is_alive():
-            return
-            
-        self._stop_watching.clear()
-        self._watcher_thread = threading.Thread(target=self._watch_loop, args=(callback,), daemon=True)
+        ready = threading.Event()
+        previous = self._watcher_thread
+        if previous is not None and previous.is_alive():
+            if not self._stop_watching.is_set():
+                ready.set()
+                return ready
+            # Still being stopped: wait until it is torn down, so it cannot
+            # be taken for the new watch.
+            if previous is not threading.current_thread():
+                previous.join()
+
+        # Each watch has its own stop event, so one still winding down (e.g.
+        # restarted from its own callback, which cannot wait for itself)
+        # never sees the new one cleared.
+        stop = self._stop_watching = StopEvent()
+
+        if not polling and has_inotify():
+            # No thread of its own: registered with the shared watch hub
+            watcher = InotifyFileWatcher(self._loaded_files, lambda: self._reload(callback), debounce)
+            try:
+                self._watcher_thread = watcher.start(stop)
+            except OSError:
+                # A watch could not be set up (e.g. the directory does not
+                # exist yet): polling still picks the files up once they appear.
+                polling = True
+            else:
+                ready.set()
+                return ready
+
+        if polling or not has_event_backend():
+            target, args = self._watch_loop, (callback, ready, stop)
+        else:
+            target, args = self._watch_events, (callback, ready, stop, debounce)
+
+        self._watcher_thread = threading.Thread(target=target, args=args, daemon=True)
         self._watcher_thread.start()
+        return ready
+
+    def _watch_events(self, callback: Callable[['BaseConfig'], None], ready: threading.Event,
+                      stop: threading.Event, debounce: float):
+        watcher = AsyncFileWatcher(self._loaded_files, lambda: self._reload(callback), debounce)
+        try:
+            watcher.run(stop, ready)
+        except OSError:
+            if ready.is_set():
+                raise
+            # Same fallback as for inotify: poll until the files appear
+            self._watch_loop(callback, ready, stop)
         
-    def _watch_loop(self, callback: Callable[['BaseConfig'], None]):
-        # Track mtimes
-        mtimes = {}
-        for p in self._loaded_files:
-            if os.path.exists(p):
-                mtimes[p] = os.path.getmtime(p)
+    def _watch_loop(self, callback: Callable[['BaseConfig'], None], ready: threading.Event,
+                    stop: threading.Event):
+        # Track file stamps, one directory scan per tick for all files in it
+        groups = group_by_directory(self._loaded_files)
+        stamps = scan_stamps(groups)
+        ready.set()
                 
-        while not self._stop_watching.is_set():
-            time.sleep(1) # Poll interval
-            changed = False
-            for p in self._loaded_files:
-                if os.path.exists(p):
-                    current_mtime = os.path.getmtime(p)
-                    if current_mtime != mtimes.get(p):
-                        mtimes[p] = current_mtime
-                        changed = True
+        while not stop.wait(1): # Poll interval
+            current_stamps = scan_stamps(groups)
+            changed = current_stamps != stamps
+            stamps = current_stamps
             
             if changed:
-                # Reload variables
-                new_vars = self._load_and_merge(self._loaded_files)
-                # Temporarily unfreeze to update
-                self._frozen = False
-                self._env_vars = new_vars
-                # Re-apply fields? 
-                # Yes, because values might have changed.
-                # This re-runs casting and validation.
-                try:
-                    self._apply_fields()
-                    if callback:
-                        callback(self)
-                except Exception as e:
-                    # If reload fails (validation error), we might log it but keep old state?
-                    # Or just crash the thread?
-                    # Ideally log it. For now, print?
-                    print(f"Error reloading config: {e}")
-                finally:
-                    self._frozen = True
-
-    def generate_markdown_docs(self) -> str:
+                self._reload(callback)
+
+    def _reload(self, callback: Callable[['BaseConfig'], None]):
+        # Reload variables
+        # Only the variables actually read by the fields are compared, with
+        # every layer (overrides, os.environ, files) resolved: os.environ is
+        # live, so its values at the last applied load are taken from the
+        # snapshot. The snapshot is only replaced once a reload fully
+        # succeeded, so the diff is always against the values currently applied.
+        old_vars = self._env_vars
+        old_snapshot = self._env_snapshot
+        if old_snapshot is None:  # a nested config watched on its own
+            old_snapshot = self._snapshot(old_vars)
+        new_vars = self._load_and_merge(self._loaded_files)
+        new_snapshot = self._snapshot(new_vars)
+        changed_keys = {k for k, v in new_snapshot.items() if old_snapshot.get(k, _MISSING) != v}
+
+        if not changed_keys:
+            # e.g. a file saved again with the same contents: nothing to
+            # rebuild, and the callback is not fired for a no-op.
+            self._env_vars = new_vars
+            return
+
+        # Temporarily unfreeze to update
+        self._frozen = False
+        old_values = {name: getattr(self, name) for name in self._field_names}
+        # _apply_fields reads the new variables from `self._env_vars`
+        self._env_vars = new_vars
+        # Re-cast and re-validate only the fields whose variables changed,
+        # then re-run cross-field validation.
+        try:
+            try:
+                self._apply_fields(changed_keys)
+                self.hook()
+                self._env_snapshot = new_snapshot
+            except Exception:
+                # Keep the old state: values and the variables they came from
+                self._env_vars = old_vars
+                for name, value in old_values.items():
+                    object.__setattr__(self, name, value)
+                raise
+            if callback:
+                callback(self)
+        except Exception as e:
+            # The error is reported and the previous configuration stays in place
+            print(f"Error reloading config: {e}")
+        finally:
+            self._frozen = True
+
+    @classmethod
+    def generate_markdown_docs(cls) -> str:
         """
         Generate Markdown documentation for the configuration.
+
+        The output only depends on the class definition, so it is built once
+        per class. Can be called on the class or on an instance.
         """
-        lines = [f"# {self.__class__.__name__} Configuration", ""]
+        cached = vars(cls).get('__envifrog_md__')
+        if cached is not None:
+            return cached
+
+        lines = [f"# {cls.__name__} Configuration", ""]
         lines.append("| Variable Name | Type | Default | Description | Secret |")
         lines.append("|---|---|---|---|---|")
         
-        cls = self.__class__
-        try:
-            hints = get_type_hints(cls)
-        except Exception:
-            hints = cls.__annotations__
+        hints = _cached_hints(cls)
             
         for name, typ in hints.items():
             if name.startswith('_'): continue
             
             # Get default
-            field_val = getattr(cls, name, Var(default=...))
-            if not isinstance(field_val, Var):
-                 field_val = Var(default=field_val)
+            field_val = _field_var(cls, name)
             
             default_val = field_val.default
             if default_val is ...:
@@ -316,7 +705,9 @@ class BaseConfig:
             
             lines.append(f"| `{name}` | `{type_name}` | {default_str} | {desc} | {is_secret} |")
             
-        return "\n".join(lines)
+        md = "\n".join(lines)
+        cls.__envifrog_md__ = md
+        return md
 
     def __repr__(self) -> str:
         # Improved Repr
@@ -326,19 +717,57 @@ class BaseConfig:
         indent_str = "    " * indent
         if isinstance(obj, BaseConfig):
             lines = [f"{obj.__class__.__name__}("]
-            d = obj.to_dict(show_secrets=False, show_computed=True)
-            for k, v in d.items():
-                if isinstance(v, dict):
-                    # It's a nested dict from a nested config? 
-                    # We need the actual object to recurse nicely if we want to show class name.
-                    # But to_dict converts to dict.
-                    # Let's get the attribute directly.
-                    real_val = getattr(obj, k)
-                    val_str = self._repr_recursive(real_val, indent + 1)
+            for k in _properties_of(obj.__class__):
+                lines.append(f"{indent_str}    {k}={getattr(obj, k)!r},")
+            for k in obj._field_names:
+                v = getattr(obj, k)
+                if isinstance(v, BaseConfig):
+                    val_str = self._repr_recursive(v, indent + 1)
                     lines.append(f"{indent_str}    {k}={val_str.lstrip()}") # lstrip to remove its indent if we concat
+                elif k in obj._secrets:
+                    lines.append(f"{indent_str}    {k}='********',")
                 else:
                     lines.append(f"{indent_str}    {k}={v!r},")
             lines.append(f"{indent_str})")
             return "\n".join(lines)
         else:
              return repr(obj)
+
+
+class _SlottedMeta(type):
+    """
+    Metaclass generating `__slots__` for the annotated fields of a config class.
+
+    Class-level defaults would clash with the slot descriptors, so they are
+    moved to `__envifrog_defaults__` before the class is created.
+    """
+
+    def __new__(mcs, name, bases, namespace, **kwargs):
+        if '__slots__' not in namespace:
+            annotations = namespace.get('__annotations__', {})
+            fields = [f for f in annotations if not f.startswith('_')]
+
+            defaults: Dict[str, Any] = {}
+            inherited = set()
+            for base in reversed(bases):
+                defaults.update(getattr(base, '__envifrog_defaults__', {}))
+                for klass in base.__mro__:
+                    inherited.update(vars(klass).get('__annotations__', {}))
+            # Also defaults overriding an inherited field without re-annotating
+            # it, which would otherwise shadow the parent's slot.
+            for field in (*fields, *inherited):
+                if field in namespace and not field.startswith('_'):
+                    defaults[field] = namespace.pop(field)
+
+            namespace['__slots__'] = tuple(fields)
+            namespace['__envifrog_defaults__'] = defaults
+            namespace['_slotted'] = True
+        return super().__new__(mcs, name, bases, namespace, **kwargs)
+
+
+class BaseConfigSlotted(BaseConfig, metaclass=_SlottedMeta):
+    """
+    Variant of `BaseConfig` storing fields in `__slots__` for faster attribute access.
+
+    Subclasses must not define `__slots__` themselves.
+    """
@@ -1,25 +1,35 @@
 import sys
 import os
 import argparse
-import inspect
+import hashlib
 import importlib.util
-from typing import Type
-from .base import BaseConfig
+from typing import Any, Dict, Tuple, Type
+from .base import BaseConfig, _cached_hints, _field_var
 from .fields import Var
 
+# Imported config classes keyed by (absolute path, mtime_ns, class name)
+_CLS_CACHE: Dict[Tuple[str, int, str], Type[BaseConfig]] = {}
+
 def import_config_class(file_path: str, class_name: str) -> Type[BaseConfig]:
     """Dynamically import a class from a python file."""
+    abs_path = os.path.abspath(file_path)
+    cache_key = (abs_path, os.stat(abs_path).st_mtime_ns, class_name)
+    if cache_key in _CLS_CACHE:
+        return _CLS_CACHE[cache_key]
+
     # Add file directory to sys.path to allow relative imports inside that file
-    file_dir = os.path.dirname(os.path.abspath(file_path))
+    file_dir = os.path.dirname(abs_path)
     if file_dir not in sys.path:
         sys.path.insert(0, file_dir)
         
-    spec = importlib.util.spec_from_file_location("config_module", file_path)
+    # Unique module name per file, so several config files can coexist
+    module_name = "envifrog_config_" + hashlib.sha1(abs_path.encode("utf-8")).hexdigest()[:16]
+    spec = importlib.util.spec_from_file_location(module_name, abs_path)
     if spec is None or spec.loader is None:
         raise ImportError(f"Could not load file: {file_path}")
     
     module = importlib.util.module_from_spec(spec)
-    sys.modules["config_module"] = module
+    sys.modules[module_name] = module
     spec.loader.exec_module(module)
     
     if not hasattr(module, class_name):
@@ -29,8 +39,23 @@ def import_config_class(file_path: str, class_name: str) -> Type[BaseConfig]:
     if not issubclass(cls, BaseConfig):
         raise TypeError(f"{class_name} must be a subclass of BaseConfig")
         
+    _CLS_CACHE[cache_key] = cls
     return cls
 
+def _plan_for_docs(cls: Type[BaseConfig]) -> Tuple[Tuple[str, Any, Var], ...]:
+    """Public fields of a config class as (name, type, Var) tuples."""
+    # Cached on the class itself, which a module-level cache would keep alive
+    cached = vars(cls).get('__envifrog_docs_plan__')
+    if cached is not None:
+        return cached
+    plan = tuple(
+        (name, _type, _field_var(cls, name))
+        for name, _type in _cached_hints(cls).items()
+        if not name.startswith('_')
+    )
+    cls.__envifrog_docs_plan__ = plan
+    return plan
+
 def generate_example(args):
     """Generate .env.example file."""
     try:
@@ -54,20 +79,7 @@ def generate_example(args):
     def _recurse_vars(cls: Type[BaseConfig], prefix: str = "") -> list[str]:
         lines = []
         
-        # Get hints
-        hints = {}
-        try:
-            hints = inspect.get_type_hints(cls)
-        except Exception:
-            hints = cls.__annotations__
-            
-        for name, _type in hints.items():
-            if name.startswith('_'): continue
-            
-            field_val = getattr(cls, name, Var(default=...))
-            if not isinstance(field_val, Var):
-                field_val = Var(default=field_val)
-                
+        for name, _type, field_val in _plan_for_docs(cls):
             effective_prefix = prefix
             if field_val.prefix:
                 effective_prefix += field_val.prefix
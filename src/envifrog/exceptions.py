@@ -1,3 +1,6 @@
+from typing import Any, Optional
+
+
 class EnvifrogError(Exception):
     """Base exception for all envifrog errors."""
     pass
@@ -14,8 +17,25 @@ class ValidationError(EnvifrogError):
 
 
 class TypeCastingError(EnvifrogError):
-    """Raised when a variable cannot be cast to the specified type."""
-    pass
+    """
+    Raised when a variable cannot be cast to the specified type.
+
+    Either built with a message, or with the offending `value` and `target`
+    type, in which case the message is only formatted when the error is shown.
+    """
+
+    def __init__(self, message: Optional[str] = None, *, value: Any = None, target: Any = None):
+        if message is None:
+            super().__init__()
+        else:
+            super().__init__(message)
+        self.value = value
+        self.target = target
+
+    def __str__(self) -> str:
+        if not self.args and self.target is not None:
+            return f"Cannot cast '{self.value}' to {getattr(self.target, '__name__', self.target)}"
+        return super().__str__()
 
 
 class FrozenInstanceError(EnvifrogError):
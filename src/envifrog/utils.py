@@ -1,72 +1,230 @@
 import os
+import sys
+import copy
+import re
+import mmap
+import stat
 import logging
 import pathlib
-from typing import Any, Dict, List, Tuple, Type, Union, get_args, get_origin
+import functools
+import threading
+import time
+import types
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Tuple, Type, Union, get_args, get_origin
 from .exceptions import TypeCastingError
 
-try:
-    import tomllib
-except ImportError:
-    tomllib = None  # type: ignore
-
 import json
 
+# Parser backends (tomllib, orjson) are only imported once a file of that
+# format is loaded, which keeps `import envifrog` cheap.
+
+@functools.lru_cache(maxsize=None)
+def _tomllib():
+    try:
+        import tomllib
+    except ImportError:
+        return None
+    return tomllib
+
+@functools.lru_cache(maxsize=None)
+def _json_backend() -> Tuple[Callable[[Any], Any], Tuple[type, ...], bool]:
+    """Return (loads, decode errors, accepts memoryview), preferring orjson."""
+    try:
+        import orjson
+    except ImportError:
+        return json.loads, (json.JSONDecodeError,), False
+    return orjson.loads, (orjson.JSONDecodeError, json.JSONDecodeError), True
+
+# Above this many secrets, one regex alternation beats a chain of str.replace calls
+_SECRET_REGEX_MIN = 4
+
 class SecretFilter(logging.Filter):
     """
     logging.Filter that redacts secrets from log records.
+
+    Secrets are kept sorted by length (longest first), so a secret that is a
+    prefix of another one never leaves part of the longer one unredacted.
     """
+    # `secrets` is a property over `_secrets`; logging.Filter still brings a
+    # __dict__ for its own `name`/`nlen`, the hot attributes live in slots.
+    __slots__ = ('_secrets', 'replacement', '_pattern')
+
     def __init__(self, secrets: List[str], replacement: str = "[REDACTED]"):
         super().__init__()
         self.secrets = secrets
         self.replacement = replacement
 
+    @property
+    def secrets(self) -> List[str]:
+        return self._secrets
+
+    @secrets.setter
+    def secrets(self, secrets: List[str]) -> None:
+        self._secrets = sorted((s for s in secrets if s), key=len, reverse=True)
+        # Many secrets: all in one alternation, so each message is scanned once
+        if len(self._secrets) > _SECRET_REGEX_MIN:
+            self._pattern = re.compile('|'.join(map(re.escape, self._secrets)))
+        else:
+            self._pattern = None
+
     def filter(self, record: logging.LogRecord) -> bool:
         if not isinstance(record.msg, str):
             return True
-            
+
         msg = record.msg
-        for secret in self.secrets:
-            if secret and secret in msg:
-                msg = msg.replace(secret, self.replacement)
+        if record.args:
+            # Secrets can also come in through %-style arguments: redact the
+            # formatted message. Broken format strings are left to the handler.
+            try:
+                msg = record.getMessage()
+            except Exception:
+                return True
+        pattern = self._pattern
+        replacement = self.replacement
+        # Most messages contain no secret: detect that with a single scan
+        # and leave the record untouched.
+        if pattern is not None:
+            if pattern.search(msg) is None:
+                return True
+            # Callable replacement: the text is inserted literally (no backreferences)
+            msg = pattern.sub(lambda _: replacement, msg)
+        else:
+            secrets = self._secrets
+            if not any(secret in msg for secret in secrets):
+                return True
+            for secret in secrets:
+                msg = msg.replace(secret, replacement)
         record.msg = msg
+        record.args = ()
         return True
 
+# One filter per distinct set of secrets, so repeated setup calls are free
+# and never stack duplicate filters on the root logger.
+_REDACTORS: Dict[Tuple[str, ...], SecretFilter] = {}
+
 def setup_logging_redactor(secrets: List[str]) -> None:
     """
     Attach the SecretFilter to the root logger to redact known secrets.
     """
     if not secrets:
         return
-    
-    # Avoid duplicate filters if called multiple times? 
-    # For simplicity, we just add it. Users should call this once.
-    f = SecretFilter(secrets)
+
+    key = tuple(sorted(set(secrets)))
+    f = _REDACTORS.get(key)
+    if f is None:
+        f = _REDACTORS[key] = SecretFilter(list(key))
+    # addFilter() ignores a filter that is already attached
     logging.getLogger().addFilter(f)
 
+def _parser_for(path: str) -> Callable[[str], Dict[str, Any]]:
+    # Everything that is not .json/.toml is parsed as a .env file. Lowercase
+    # extensions (the usual case) are found without allocating a lowered copy.
+    dot = path.rfind('.')
+    if dot == -1:
+        return _parse_env
+    ext = path[dot:]
+    parser = _PARSERS.get(ext)
+    if parser is None and not ext.islower():
+        parser = _PARSERS.get(ext.lower())
+    return parser or _parse_env
+
 def load_config_file(path: str) -> Dict[str, Any]:
     """
     Load configuration from a file (.env, .json, .toml).
+    Parsed results are cached until the file changes; a fresh copy is returned.
     """
-    _, ext = os.path.splitext(path)
-    ext = ext.lower()
-    
-    if ext == '.json':
-        return _parse_json(path)
-    elif ext == '.toml':
-        return _parse_toml(path)
-    else:
-        return _parse_env(path)
+    return _parser_for(path)(path)
+
+def load_config_file_cached(path: str) -> Dict[str, Any]:
+    """
+    Like `load_config_file`, but without copying the cached result.
+    The returned dict is shared between callers and must not be mutated.
+    """
+    return _parser_for(path).shared(path)  # type: ignore[attr-defined]
+
+_PARSE_CACHE_MAXSIZE = 128
+# Coarsest common timestamp granularity (FAT: 2 s, HFS+: 1 s). Files modified
+# more recently than this are re-parsed instead of trusting (mtime, size).
+_RACY_WINDOW_NS = 2 * 10**9
 
+def _cached(parser: Callable[[str], Dict[str, Any]]) -> Callable[[str], Dict[str, Any]]:
+    """
+    Memoize a file parser on (file identity, mtime_ns, size), so files are only
+    re-parsed when modified. Each file keeps one entry (a modified file replaces
+    its stale result), bounded to the most recently used files. Files modified
+    within the last `_RACY_WINDOW_NS` are not cached.
+
+    Missing (or unreachable) paths and paths that are not regular files parse as `{}`.
+    The wrapper returns a deep copy; `wrapper.shared(path)` returns the cached dict itself.
+    """
+    cache: "OrderedDict[Any, Tuple[Tuple[int, int], Dict[str, Any]]]" = OrderedDict()
+    lock = threading.Lock()
+
+    def shared(path: str) -> Dict[str, Any]:
+        try:
+            st = os.stat(path)
+        except OSError:  # missing, or a path through a non-directory
+            return {}
+        if not stat.S_ISREG(st.st_mode):
+            return {}
+        # (device, inode) identifies the file through symlinks without the
+        # extra lstat calls of realpath(); fall back where inodes are not real.
+        key: Any = (st.st_dev, st.st_ino) if st.st_ino else os.path.realpath(path)
+        stamp = (st.st_mtime_ns, st.st_size)
+
+        with lock:
+            entry = cache.get(key)
+            if entry is not None and entry[0] == stamp:
+                cache.move_to_end(key)
+                return entry[1]
+
+        parsed_at = time.time_ns()
+        data = parser(path)
+        if parsed_at - st.st_mtime_ns < _RACY_WINDOW_NS:
+            # "Racy" file (as in git's index): modified so recently that a
+            # same-size rewrite could still get the same timestamp. Not
+            # cached until its mtime is safely in the past.
+            return data
+
+        with lock:
+            cache[key] = (stamp, data)
+            cache.move_to_end(key)
+            while len(cache) > _PARSE_CACHE_MAXSIZE:
+                cache.popitem(last=False)
+        return data
+
+    @functools.wraps(parser)
+    def wrapper(path: str) -> Dict[str, Any]:
+        # Nested containers (JSON/TOML) are copied too, the cache must stay intact
+        return {k: copy.deepcopy(v) if isinstance(v, (dict, list)) else v
+                for k, v in shared(path).items()}
+
+    wrapper.shared = shared  # type: ignore[attr-defined]
+    return wrapper
+
+# JSON files at least this large are memory-mapped when orjson is available
+# (the stdlib parser cannot read from a memoryview without a copy).
+_JSON_MMAP_THRESHOLD = 1024 * 1024
+
+@_cached
 def _parse_json(path: str) -> Dict[str, Any]:
+    loads, decode_errors, zero_copy = _json_backend()
     try:
-        with open(path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        with open(path, 'rb') as f:
+            if zero_copy and os.fstat(f.fileno()).st_size >= _JSON_MMAP_THRESHOLD:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    with memoryview(mm) as view:
+                        return loads(view)
+            return loads(f.read())
     except FileNotFoundError:
         return {}
-    except json.JSONDecodeError as e:
+    except decode_errors as e:
         raise TypeCastingError(f"Error parsing JSON file {path}: {e}")
 
+@_cached
 def _parse_toml(path: str) -> Dict[str, Any]:
+    tomllib = _tomllib()
     if tomllib is None:
         raise ImportError("TOML support requires Python 3.11+ (standard library 'tomllib')")
     
@@ -78,6 +236,47 @@ def _parse_toml(path: str) -> Dict[str, Any]:
     except tomllib.TOMLDecodeError as e:
         raise TypeCastingError(f"Error parsing TOML file {path}: {e}")
 
+# One `KEY=VALUE` assignment per line. Comment lines and lines without `=` never
+# match; the raw value (quotes and inline comments included) is post-processed.
+_ENV_LINE_RE = re.compile(r'^[^\S\n]*(?:([^#\s=][^=\n]*?)[^\S\n]*)?=[^\S\n]*(.*?)[^\S\n]*$', re.MULTILINE)
+_ENV_LINE_RE_BYTES = re.compile(_ENV_LINE_RE.pattern.encode('ascii'), re.MULTILINE)
+# A '\r' not followed by '\n' (old Mac line endings); '\r\n' already matches
+# as trailing whitespace before the '\n'.
+_LONE_CR_RE_BYTES = re.compile(rb'\r(?!\n)')
+
+# Files at least this large are memory-mapped instead of read; below it,
+# a plain read() is cheaper than setting up the mapping.
+_MMAP_THRESHOLD = 64 * 1024
+
+def _scan_env_mmap(fd: int) -> List[Tuple[str, str]]:
+    # Match on the mapped bytes and only decode the captured slices. The bytes
+    # pattern only knows ASCII whitespace, so slices are stripped once more and
+    # comments indented with non-ASCII whitespace are dropped here.
+    pairs = []
+    with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm:
+        if hasattr(mm, 'madvise') and hasattr(mmap, 'MADV_SEQUENTIAL'):
+            mm.madvise(mmap.MADV_SEQUENTIAL)
+        data: Any = mm
+        if _LONE_CR_RE_BYTES.search(mm) is not None:
+            # Rare: normalize a copy, as the small-file path does
+            data = mm[:].replace(b'\r\n', b'\n').replace(b'\r', b'\n')
+        for key, value in _ENV_LINE_RE_BYTES.findall(data):
+            key = key.decode('utf-8').strip()
+            if not key.startswith('#'):
+                pairs.append((key, value.decode('utf-8').strip()))
+    return pairs
+
+def _read_fd(fd: int, size: int) -> bytes:
+    # Raw os.read() sized from fstat: no buffered file object, and usually a
+    # single read plus the empty one confirming EOF.
+    chunks = []
+    while True:
+        chunk = os.read(fd, max(size, 4096))
+        if not chunk:
+            return b''.join(chunks)
+        chunks.append(chunk)
+
+@_cached
 def _parse_env(path: str) -> Dict[str, str]:
     """
     Parse a .env file into a dictionary.
@@ -85,107 +284,199 @@ def _parse_env(path: str) -> Dict[str, str]:
     """
     env_vars = {}
     try:
-        with open(path, 'r', encoding='utf-8') as f:
-            for line in f:
-                line = line.strip()
-                if not line or line.startswith('#'):
-                    continue
-                
-                if '=' in line:
-                    key, value = line.split('=', 1)
-                    key = key.strip()
-                    value = value.strip()
-                    
-                    # Handle inline comments
-                    if '#' in value:
-                        if (value.startswith('"') and '"' in value[1:]) or \
-                           (value.startswith("'") and "'" in value[1:]):
-                            # Potentially has inline comment after quote
-                            quote_char = value[0]
-                            end_idx = value.find(quote_char, 1)
-                            comment_part = value[end_idx+1:].strip()
-                            if comment_part.startswith('#'):
-                                value = value[:end_idx+1]
-                        elif not (value.startswith('"') or value.startswith("'")):
-                            value = value.split('#', 1)[0].strip()
-
-                    # Remove surrounding quotes if present
-                    if (value.startswith('"') and value.endswith('"')) or \
-                       (value.startswith("'") and value.endswith("'")):
-                        value = value[1:-1]
-                    
-                    env_vars[key] = value
+        fd = os.open(path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
     except FileNotFoundError:
-        pass # It is acceptable if the file is not found
+        return env_vars # It is acceptable if the file is not found
+
+    try:
+        size = os.fstat(fd).st_size
+        if size >= _MMAP_THRESHOLD:
+            pairs = _scan_env_mmap(fd)
+        else:
+            # One decode of the whole file, then newlines are normalized as
+            # text mode would.
+            data = _read_fd(fd, size).decode('utf-8')
+            if '\r' in data:
+                data = data.replace('\r\n', '\n').replace('\r', '\n')
+            pairs = _ENV_LINE_RE.findall(data)
+    finally:
+        os.close(fd)
+
+    for key, value in pairs:
+        # Handle inline comments (values have no surrounding whitespace here)
+        quote_char = value[:1]
+        if quote_char in ('"', "'"):
+            # Comment only after the closing quote, '#' inside quotes is kept
+            if '#' in value:
+                end_idx = value.find(quote_char, 1)
+                if end_idx != -1 and value[end_idx+1:].lstrip()[:1] == '#':
+                    value = value[:end_idx+1]
+        else:
+            value = value.partition('#')[0].rstrip()
+
+        # Remove surrounding quotes if present
+        if value and value[0] == value[-1] and value[0] in ('"', "'"):
+            value = value[1:-1]
+        
+        # Interned: keys are probed repeatedly while resolving fields
+        env_vars[sys.intern(key)] = value
     
     return env_vars
 
-def cast_value(value: str, target_type: Type[Any]) -> Any:
+_PARSERS: Dict[str, Callable[[str], Dict[str, Any]]] = {
+    '.json': _parse_json,
+    '.toml': _parse_toml,
+}
+
+def _cast_int(value: str) -> int:
+    try:
+        return int(value)
+    except ValueError:
+        raise TypeCastingError(value=value, target=int)
+
+def _cast_float(value: str) -> float:
+    try:
+        return float(value)
+    except ValueError:
+        raise TypeCastingError(value=value, target=float)
+
+# Lowercase, UPPER and Capitalized spellings are all direct hits
+_BOOL_MAP = {
+    spelling: result
+    for word, result in (
+        ('true', True), ('1', True), ('yes', True), ('on', True),
+        ('false', False), ('0', False), ('no', False), ('off', False),
+    )
+    for spelling in (word, word.upper(), word.capitalize())
+}
+_MISSING = object()
+
+def _cast_bool(value: str) -> bool:
+    # Common spellings are found without calling lower(); mixed case falls back
+    result = _BOOL_MAP.get(value, _MISSING)
+    if result is _MISSING:
+        result = _BOOL_MAP.get(value.lower(), _MISSING)
+        if result is _MISSING:
+            raise TypeCastingError(value=value, target=bool)
+    return result
+
+def _cast_str(value: str) -> str:
+    return value
+
+# Casters for non-generic target types, looked up by type
+_SCALAR_CASTERS: Dict[Any, Callable[[str], Any]] = {
+    str: _cast_str,
+    int: _cast_int,
+    float: _cast_float,
+    bool: _cast_bool,
+    pathlib.Path: pathlib.Path,
+}
+
+# Item types whose builtin constructor matches their caster (modulo the error raised)
+_NUMERIC_ITEM_TYPES = (int, float)
+
+# typing.Union and PEP 604 unions (`int | None`, Python 3.10+)
+_UNION_ORIGINS = (Union, types.UnionType) if hasattr(types, 'UnionType') else (Union,)
+
+def _unsupported(target_type: Any) -> Callable[[str], Any]:
+    def cast_unsupported(value: str) -> Any:
+        raise TypeCastingError(f"Unsupported type: {target_type}")
+    return cast_unsupported
+
+def compile_caster(target_type: Type[Any]) -> Callable[[str], Any]:
     """
-    Cast a string value to the target type.
-    Supports int, float, bool, list, tuple, pathlib.Path, and Optional/Union.
+    Build a function casting a string value to the target type.
+
+    All typing introspection (Optional/Union unwrapping, container kind, item
+    type) happens here, once; the returned function only converts values.
+    Unsupported types raise TypeCastingError when the caster is called.
     """
     # 1. Handle Optional/Union types
     origin = get_origin(target_type)
     args = get_args(target_type)
     
-    if origin is Union:
+    if origin in _UNION_ORIGINS:
         # We only support Optional[T] style (Union[T, None]) efficiently
         non_none_args = [arg for arg in args if arg is not type(None)]
+
+        # Try the first non-None type
+        inner = compile_caster(non_none_args[0]) if non_none_args else _unsupported(target_type)
+
+        if type(None) not in args:
+            return inner
+
+        def cast_optional(value: str) -> Any:
+            # If value is empty and Optional, return None
+            if value is None or value == "":
+                return None
+            return inner(value)
+        return cast_optional
+
+    # 2. Scalars (str, Path, primitives)
+    try:
+        caster = _SCALAR_CASTERS.get(target_type)
+    except TypeError:  # unhashable hint
+        caster = None
+    if caster is not None:
+        return caster
         
-        # If value is empty and Optional, return None
-        if type(None) in args and (value is None or value == ""):
-            return None
-            
-        if non_none_args:
-            # Try the first non-None type
-            target_type = non_none_args[0]
-            origin = get_origin(target_type)
-            args = get_args(target_type)
-
-    # 2. String (no cast needed)
-    if target_type == str:
-        return value
-    
-    # 3. Path
-    if target_type == pathlib.Path:
-        return pathlib.Path(value)
-    
-    # 4. Primitives
-    if target_type == int:
-        try:
-            return int(value)
-        except ValueError:
-            raise TypeCastingError(f"Cannot cast '{value}' to int")
-            
-    if target_type == float:
-        try:
-            return float(value)
-        except ValueError:
-            raise TypeCastingError(f"Cannot cast '{value}' to float")
-            
-    if target_type == bool:
-        lower_val = value.lower()
-        if lower_val in ('true', '1', 'yes', 'on'):
-            return True
-        if lower_val in ('false', '0', 'no', 'off'):
-            return False
-        raise TypeCastingError(f"Cannot cast '{value}' to bool")
-        
-    # 5. Iterables (List/Tuple)
+    # 3. Iterables (List/Tuple)
     if origin in (list, tuple) or target_type in (list, tuple):
-        items = [item.strip() for item in value.split(',')]
-        
+        as_tuple = origin is tuple or target_type == tuple
         # Determine inner type if specified (e.g. list[int])
-        if args:
-            item_type = args[0]
-            casted_items = [cast_value(item, item_type) for item in items]
+        item_caster = compile_caster(args[0]) if args else None
+
+        # Strip and cast in a single pass over the split parts
+        if item_caster is None or item_caster is _cast_str:
+            def cast_list(value: str) -> List[Any]:
+                return [item.strip() for item in value.split(',')]
+        elif args[0] in _NUMERIC_ITEM_TYPES:
+            # int()/float() ignore surrounding whitespace themselves, so the
+            # whole conversion runs in C via map(). On failure, redo it item
+            # by item to raise the usual TypeCastingError.
+            numeric = args[0]
+            def cast_list(value: str) -> List[Any]:
+                try:
+                    return list(map(numeric, value.split(',')))
+                except ValueError:
+                    return [item_caster(item.strip()) for item in value.split(',')]
         else:
-            casted_items = items
-            
-        if origin is tuple or target_type == tuple:
-            return tuple(casted_items)
-        return casted_items
+            def cast_list(value: str) -> List[Any]:
+                return [item_caster(item.strip()) for item in value.split(',')]
+
+        if not as_tuple:
+            return cast_list
+
+        def cast_items(value: str) -> Any:
+            return tuple(cast_list(value))
+        return cast_items
 
     # Fallback/Fail
-    raise TypeCastingError(f"Unsupported type: {target_type}")
+    return _unsupported(target_type)
+
+def _hint_key(target_type: Any) -> Any:
+    # Unions compare equal regardless of member order (Union[int, str] ==
+    # Union[str, int]), but the first member decides the cast: the key
+    # spells out the arguments, recursively and in order.
+    args = get_args(target_type)
+    if not args:
+        return target_type
+    return (target_type, tuple(_hint_key(arg) for arg in args))
+
+@functools.lru_cache(maxsize=256)
+def _compile_caster_keyed(key: Any, target_type: Any) -> Callable[[str], Any]:
+    return compile_caster(target_type)
+
+def _compile_caster_cached(target_type: Any) -> Callable[[str], Any]:
+    return _compile_caster_keyed(_hint_key(target_type), target_type)
+
+def cast_value(value: str, target_type: Type[Any]) -> Any:
+    """
+    Cast a string value to the target type.
+    Supports int, float, bool, list, tuple, pathlib.Path, and Optional/Union.
+    """
+    try:
+        caster = _compile_caster_cached(target_type)
+    except TypeError:  # unhashable hint
+        caster = compile_caster(target_type)
+    return caster(value)
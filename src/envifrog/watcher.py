@@ -0,0 +1,426 @@
+import os
+import sys
+import errno
+import time
+import struct
+import functools
+import selectors
+import threading
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+# inotify(7) constants, see <sys/inotify.h>
+_IN_MOVED_FROM = 0x00000040
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_NONBLOCK = os.O_NONBLOCK
+_IN_CLOEXEC = getattr(os, 'O_CLOEXEC', 0o2000000)
+# Only events that leave a file with new contents (or remove it)
+_IN_MASK = _IN_CLOSE_WRITE | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE | _IN_MOVED_FROM
+_IN_EVENT = struct.Struct('iIII')  # wd, mask, cookie, len (name follows)
+
+# Backends are loaded on the first watch() rather than on `import envifrog`.
+
+@functools.lru_cache(maxsize=None)
+def _libc() -> Any:
+    """The C library if it provides inotify (Linux), else None."""
+    if not sys.platform.startswith('linux'):
+        return None
+    import ctypes
+    import ctypes.util
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or None, use_errno=True)
+        libc.inotify_init1  # may be missing on exotic libcs
+    except (OSError, AttributeError):
+        return None
+    return libc
+
+
+@functools.lru_cache(maxsize=None)
+def _watchdog() -> Optional[Tuple[Any, type]]:
+    """(Observer, event handler class) if `watchdog` is installed, else None."""
+    try:
+        from watchdog.observers import Observer
+        from watchdog.events import PatternMatchingEventHandler
+    except ImportError:
+        return None
+
+    class _ChangeHandler(PatternMatchingEventHandler):
+        """Forwards any event on a watched file to the owning watcher."""
+
+        def __init__(self, watcher: "AsyncFileWatcher", patterns: List[str]):
+            super().__init__(patterns=patterns, ignore_directories=True, case_sensitive=True)
+            self._watcher = watcher
+
+        def on_any_event(self, event) -> None:
+            if event.event_type in ('opened', 'closed_no_write'):
+                return
+            self._watcher.notify()
+
+    return Observer, _ChangeHandler
+
+
+def has_inotify() -> bool:
+    """Return True if the native Linux inotify API is usable."""
+    return _libc() is not None
+
+
+def has_event_backend() -> bool:
+    """Return True if an event-driven file watching backend is available."""
+    return has_inotify() or _watchdog() is not None
+
+
+class StopEvent(threading.Event):
+    """
+    `threading.Event` that also wakes up watchers blocked in `select()`.
+
+    Watchers register the write end of a self-pipe; `set()` writes a byte to
+    each of them so a blocking wait returns immediately.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._wakeup_fds: Set[int] = set()
+        self._fds_lock = threading.Lock()
+
+    def add_wakeup_fd(self, fd: int) -> None:
+        with self._fds_lock:
+            self._wakeup_fds.add(fd)
+
+    def remove_wakeup_fd(self, fd: int) -> None:
+        with self._fds_lock:
+            self._wakeup_fds.discard(fd)
+
+    def set(self) -> None:
+        super().set()
+        with self._fds_lock:
+            for fd in self._wakeup_fds:
+                try:
+                    os.write(fd, b'\0')
+                except OSError:
+                    pass
+
+
+def group_by_directory(paths: List[str]) -> Dict[str, Set[str]]:
+    """Group file paths by their parent directory: {directory: {basename, ...}}."""
+    groups: Dict[str, Set[str]] = {}
+    for path in paths:
+        directory, name = os.path.split(os.path.abspath(path))
+        groups.setdefault(directory, set()).add(name)
+    return groups
+
+
+def watched_paths(paths: List[str]) -> List[str]:
+    """
+    Absolute paths to watch for the given files.
+
+    A symlinked file is watched both as the link (it may be replaced) and as
+    its target (which is where writes actually happen).
+    """
+    watched: List[str] = []
+    for path in paths:
+        for candidate in (os.path.abspath(path), os.path.realpath(path)):
+            if candidate not in watched:
+                watched.append(candidate)
+    return watched
+
+
+def scan_stamps(groups: Dict[str, Set[str]]) -> Dict[str, Tuple[int, int, int]]:
+    """
+    Return (mtime_ns, size, inode) of the grouped files that exist.
+
+    Uses a single `os.scandir` per directory instead of stat-ing each file.
+    Size and inode catch changes within the filesystem's mtime granularity
+    (the inode changes whenever a file is atomically replaced).
+    """
+    stamps: Dict[str, Tuple[int, int, int]] = {}
+    for directory, names in groups.items():
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    if entry.name in names:
+                        st = entry.stat()
+                        stamps[entry.path] = (st.st_mtime_ns, st.st_size, st.st_ino)
+        except OSError:
+            continue
+    return stamps
+
+
+class AsyncFileWatcher:
+    """
+    Event-driven file watcher backed by `watchdog` (inotify/FSEvents/ReadDirectoryChangesW).
+
+    The parent directories of the given files are watched (editors often replace
+    files instead of writing in place) and events are filtered on the file paths.
+    Bursts of events within `debounce` seconds collapse into a single `on_change` call.
+    """
+
+    def __init__(self, paths: List[str], on_change: Callable[[], None], debounce: float = 0.1):
+        if _watchdog() is None:
+            raise ImportError("Event-driven watching requires the 'watchdog' package")
+
+        self.paths = watched_paths(paths)
+        self.on_change = on_change
+        self.debounce = debounce
+        self._timer: Optional[threading.Timer] = None
+        self._lock = threading.Lock()
+        # cancel() cannot stop a timer that already fired: one still running
+        # `on_change` when the next one fires is waited for, never overlapped.
+        self._change_lock = threading.Lock()
+
+    def notify(self) -> None:
+        """Schedule `on_change`, restarting the debounce window."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+            self._timer = threading.Timer(self.debounce, self._fire)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _fire(self) -> None:
+        with self._change_lock:
+            self.on_change()
+
+    def run(self, stop_event: threading.Event, ready: Optional[threading.Event] = None) -> None:
+        """
+        Watch until `stop_event` is set. Blocks the calling thread.
+
+        `ready` is set once the observer is running. Raises OSError (before
+        setting it) if a parent directory cannot be watched.
+        """
+        observer_cls, handler_cls = _watchdog()
+        handler = handler_cls(self, self.paths)
+        observer = observer_cls()
+        for directory in sorted({os.path.dirname(p) for p in self.paths}):
+            if not os.path.isdir(directory):
+                raise FileNotFoundError(errno.ENOENT, os.strerror(errno.ENOENT), directory)
+            observer.schedule(handler, directory, recursive=False)
+        observer.start()
+        if ready is not None:
+            ready.set()
+        try:
+            stop_event.wait()
+        finally:
+            observer.stop()
+            observer.join()
+            with self._lock:
+                if self._timer is not None:
+                    self._timer.cancel()
+                    self._timer = None
+
+
+class WatchHub:
+    """
+    One process-wide daemon thread multiplexing every inotify watch.
+
+    Watches register file descriptors with a `selectors` selector (epoll on
+    Linux), so any number of watched configs costs a single thread blocked in
+    one `epoll_wait`. Debounce windows are timers on the same loop. Callbacks
+    run on the hub thread, one at a time.
+    """
+
+    _instance: Optional["WatchHub"] = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self):
+        self._selector = selectors.DefaultSelector()
+        self._lock = threading.Lock()
+        self._callbacks: Dict[int, Callable[[], None]] = {}
+        self._timers: Dict[object, Tuple[float, Callable[[], None]]] = {}
+        self._thread: Optional[threading.Thread] = None
+        # Self-pipe waking the loop up when registrations or timers change
+        self._wake_r, self._wake_w = os.pipe()
+        os.set_blocking(self._wake_r, False)
+        os.set_blocking(self._wake_w, False)
+        self._selector.register(self._wake_r, selectors.EVENT_READ)
+
+    @classmethod
+    def instance(cls) -> "WatchHub":
+        """Return the shared hub, creating it on first use."""
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+            return cls._instance
+
+    def register(self, fd: int, callback: Callable[[], None]) -> None:
+        """Call `callback()` on the hub thread whenever `fd` is readable."""
+        with self._lock:
+            self._callbacks[fd] = callback
+            self._selector.register(fd, selectors.EVENT_READ)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='envifrog-watch-hub', daemon=True)
+                self._thread.start()
+        self._wake()
+
+    def unregister(self, fd: int) -> None:
+        with self._lock:
+            if self._callbacks.pop(fd, None) is not None:
+                self._selector.unregister(fd)
+        self._wake()
+
+    def call_later(self, key: object, delay: float, callback: Callable[[], None]) -> None:
+        """Run `callback` after `delay` seconds, replacing any timer pending for `key`."""
+        with self._lock:
+            self._timers[key] = (time.monotonic() + delay, callback)
+        self._wake()
+
+    def cancel(self, key: object) -> None:
+        with self._lock:
+            self._timers.pop(key, None)
+
+    def _wake(self) -> None:
+        try:
+            os.write(self._wake_w, b'\0')
+        except BlockingIOError:
+            pass  # already pending
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                deadline = min((d for d, _ in self._timers.values()), default=None)
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+
+            for key, _ in self._selector.select(timeout):
+                if key.fd == self._wake_r:
+                    try:
+                        os.read(self._wake_r, 4096)
+                    except BlockingIOError:
+                        pass
+                    continue
+                with self._lock:
+                    callback = self._callbacks.get(key.fd)
+                if callback is not None:
+                    self._dispatch(callback)
+
+            now = time.monotonic()
+            with self._lock:
+                due = [k for k, (d, _) in self._timers.items() if d <= now]
+                callbacks = [self._timers.pop(k)[1] for k in due]
+            for callback in callbacks:
+                self._dispatch(callback)
+
+    @staticmethod
+    def _dispatch(callback: Callable[[], None]) -> None:
+        # A failing watch must not take down the others sharing the thread
+        try:
+            callback()
+        except Exception as e:
+            print(f"Error in config watcher: {e}")
+
+
+class HubWatch:
+    """
+    Handle for a watch running on the `WatchHub`.
+
+    Stands in for the watcher thread: `is_alive()` until the stop event is set,
+    and `join()` waits for the watch to be torn down.
+    """
+
+    def __init__(self, hub: WatchHub):
+        self._hub = hub
+        self._closed = threading.Event()
+
+    def is_alive(self) -> bool:
+        return not self._closed.is_set()
+
+    def join(self, timeout: Optional[float] = None) -> None:
+        # On the hub thread (from a watch callback), the teardown can only
+        # run once that callback returns: waiting would never end.
+        if threading.current_thread() is self._hub._thread:
+            return
+        self._closed.wait(timeout)
+
+
+def _raise_errno(filename: Optional[str] = None) -> None:
+    import ctypes
+    err = ctypes.get_errno()
+    raise OSError(err, os.strerror(err), filename)
+
+
+class InotifyFileWatcher:
+    """
+    Event-driven file watcher using the Linux inotify API directly (via ctypes).
+
+    Like `AsyncFileWatcher`, the parent directories are watched and events are
+    filtered by file name. Instead of a thread of its own, the watch is
+    registered with the shared `WatchHub`; events within `debounce` seconds of
+    each other collapse into a single `on_change` call.
+    """
+
+    def __init__(self, paths: List[str], on_change: Callable[[], None], debounce: float = 0.1):
+        self._libc = _libc()
+        if self._libc is None:
+            raise OSError("inotify is not available on this platform")
+
+        self.paths = watched_paths(paths)
+        self.on_change = on_change
+        self.debounce = debounce
+
+    def _add_watches(self, fd: int) -> Dict[int, Set[bytes]]:
+        names_by_wd: Dict[int, Set[bytes]] = {}
+        for directory, names in group_by_directory(self.paths).items():
+            wd = self._libc.inotify_add_watch(fd, os.fsencode(directory), _IN_MASK)
+            if wd < 0:  # e.g. directory not created yet, or watch limit reached
+                _raise_errno(directory)
+            names_by_wd.setdefault(wd, set()).update(os.fsencode(n) for n in names)
+        return names_by_wd
+
+    @staticmethod
+    def _matches(data: bytes, names_by_wd: Dict[int, Set[bytes]]) -> bool:
+        offset, size = 0, _IN_EVENT.size
+        while offset + size <= len(data):
+            wd, _mask, _cookie, length = _IN_EVENT.unpack_from(data, offset)
+            name = data[offset + size:offset + size + length].rstrip(b'\0')
+            offset += size + length
+            if name in names_by_wd.get(wd, ()):
+                return True
+        return False
+
+    def start(self, stop_event: StopEvent, hub: Optional[WatchHub] = None) -> HubWatch:
+        """
+        Start watching on the hub until `stop_event` is set.
+
+        Raises OSError if a watch cannot be set up (no inotify instance left,
+        a parent directory missing, or the watch limit reached).
+        """
+        hub = hub or WatchHub.instance()
+        fd = self._libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if fd < 0:
+            _raise_errno()
+        try:
+            names_by_wd = self._add_watches(fd)
+        except OSError:
+            os.close(fd)
+            raise
+
+        handle = HubWatch(hub)
+        wake_r, wake_w = os.pipe()
+
+        def on_events() -> None:
+            try:
+                data = os.read(fd, 64 * 1024)
+            except BlockingIOError:
+                return
+            if self._matches(data, names_by_wd):
+                # (Re)start the debounce window
+                hub.call_later(handle, self.debounce, self.on_change)
+
+        def on_stop() -> None:
+            if not stop_event.is_set():
+                os.read(wake_r, 4096)  # stale wakeup from an earlier set()
+                return
+            stop_event.remove_wakeup_fd(wake_w)
+            hub.unregister(fd)
+            hub.unregister(wake_r)
+            hub.cancel(handle)
+            for f in (fd, wake_r, wake_w):
+                os.close(f)
+            handle._closed.set()
+
+        stop_event.add_wakeup_fd(wake_w)
+        hub.register(fd, on_events)
+        hub.register(wake_r, on_stop)
+        if stop_event.is_set():
+            stop_event.set()  # set before registration: wake on_stop now
+        return handle
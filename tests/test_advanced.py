@@ -93,6 +93,26 @@ class TestAdvancedFeatures(unittest.TestCase):
         finally:
             os.remove(fname)
 
+    def test_json_containers_not_shared(self):
+        class ContainerConfig(BaseConfig):
+            HOSTS: list = []
+            OPTS: dict = {}
+
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+            json.dump({"HOSTS": ["a"], "OPTS": {"x": 1}}, f)
+            fname = f.name
+
+        try:
+            first = ContainerConfig(env_path=fname)
+            first.HOSTS.append("x")
+            first.OPTS["y"] = 2
+
+            second = ContainerConfig(env_path=fname)
+            self.assertEqual(second.HOSTS, ["a"])
+            self.assertEqual(second.OPTS, {"x": 1})
+        finally:
+            os.remove(fname)
+
     def test_toml_loading(self):
         if not HAS_TOML:
             print("Skipping TOML test (tomllib not available)")
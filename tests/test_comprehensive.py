@@ -8,7 +8,7 @@ import time
 import pathlib
 from typing import Optional, List, Tuple, Union
 from envifrog import BaseConfig, Var, MissingVariableError, ValidationError, TypeCastingError, FrozenInstanceError
-from envifrog.utils import setup_logging_redactor, cast_value
+from envifrog.utils import setup_logging_redactor, cast_value, load_config_file_cached
 from envifrog.cli import generate_example, check_health
 from unittest.mock import patch, MagicMock
 import io
@@ -155,6 +155,18 @@ class TestComprehensive(unittest.TestCase):
         self.assertEqual(full['DB_PASS'], 'pass123')
         self.assertEqual(full['NESTED']['API_KEY'], 'key456')
 
+    def test_to_dict_only_fields(self):
+        """Test that to_dict only includes declared fields."""
+        class PlainConfig(BaseConfig):
+            FIELD: str = "value"
+            NOT_A_FIELD = "ignored"
+
+            def helper(self):
+                return 1
+
+        cfg = PlainConfig()
+        self.assertEqual(cfg.to_dict(), {"FIELD": "value"})
+
     def test_dotenv_parsing_robustness(self):
         """Test .env parsing with quotes, spaces, etc."""
         with tempfile.NamedTemporaryFile(mode='w+', delete=False, encoding='utf-8') as tmp:
@@ -181,6 +193,64 @@ class TestComprehensive(unittest.TestCase):
         finally:
             os.remove(tmp_path)
 
+    def test_dotenv_parsing_large_file(self):
+        """Test that large .env files (memory-mapped) parse like small ones."""
+        with tempfile.NamedTemporaryFile(mode='w+', delete=False, encoding='utf-8') as tmp:
+            tmp.write("# padding\n" * 8000)
+            tmp.write('BIG1 = " quoted value " # comment\r\n')
+            tmp.write("BIG2=unquoted # comment\n")
+            tmp.write("  # BIG3=commented out\n")
+            tmp_path = tmp.name
+
+        try:
+            class BigConfig(BaseConfig):
+                BIG1: str
+                BIG2: str
+                BIG3: str = "default"
+
+            cfg = BigConfig(env_path=tmp_path)
+            self.assertEqual(cfg.BIG1, " quoted value ")
+            self.assertEqual(cfg.BIG2, "unquoted")
+            self.assertEqual(cfg.BIG3, "default")
+
+            # Lone '\r' line endings
+            with open(tmp_path, 'w', encoding='utf-8', newline='') as tmp:
+                tmp.write("# padding\r" * 8000)
+                tmp.write("BIG1=1\rBIG2=2")
+            cfg = BigConfig(env_path=tmp_path)
+            self.assertEqual((cfg.BIG1, cfg.BIG2), ("1", "2"))
+        finally:
+            os.remove(tmp_path)
+
+    def test_file_cache(self):
+        """Test that unchanged files are parsed once and changed files re-parsed."""
+        with tempfile.NamedTemporaryFile(mode='w+', delete=False, encoding='utf-8') as f:
+            f.write("CACHED=1")
+            path = f.name
+
+        try:
+            # Same-size rewrite keeping the timestamp (coarse-mtime filesystems):
+            # a just-written file is never trusted from the cache
+            st = os.stat(path)
+            self.assertEqual(load_config_file_cached(path), {"CACHED": "1"})
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write("CACHED=2")
+            os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+            self.assertEqual(load_config_file_cached(path), {"CACHED": "2"})
+
+            # Once the mtime is safely in the past, the parse is cached
+            old = time.time_ns() - 10 * 10**9
+            os.utime(path, ns=(old, old))
+            first = load_config_file_cached(path)
+            self.assertIs(load_config_file_cached(path), first)
+
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write("CACHED=3")
+            self.assertEqual(load_config_file_cached(path), {"CACHED": "3"})
+        finally:
+            os.remove(path)
+        self.assertEqual(load_config_file_cached(path), {})
+
     def test_priority_merging(self):
         """Test merging priority: OS > File 2 > File 1."""
         with tempfile.NamedTemporaryFile(mode='w+', delete=False, encoding='utf-8') as f1:
@@ -266,6 +336,14 @@ class DummyConfig(BaseConfig):
             os.remove(dummy_path)
             os.remove(env_path)
 
+    def test_cast_value_union_order(self):
+        """Test that cast_value follows the member order of each Union."""
+        self.assertEqual(cast_value('1', Union[int, str]), 1)
+        self.assertEqual(cast_value('1', Union[str, int]), '1')
+        self.assertEqual(cast_value('1,2', list[Union[int, str]]), [1, 2])
+        self.assertEqual(cast_value('1,2', list[Union[str, int]]), ['1', '2'])
+        self.assertIsNone(cast_value('', int | None))
+
     def test_unsupported_type_error(self):
         """Test that unsupported types raise TypeCastingError."""
         class BadTypeConfig(BaseConfig):
@@ -1,13 +1,17 @@
 import os
+import copy
+import gc
+import weakref
 import unittest
 import tempfile
 import logging
 import threading
 import time
 from pathlib import Path
-from typing import Optional, Tuple, List, Union
+from unittest import mock
+from typing import Annotated, Optional, Tuple, List, Union, get_type_hints
 
-from envifrog import BaseConfig, Var, FrozenInstanceError
+from envifrog import BaseConfig, BaseConfigSlotted, Var, FrozenInstanceError, MissingVariableError
 from envifrog.utils import setup_logging_redactor
 
 class TestFeatures(unittest.TestCase):
@@ -24,6 +28,90 @@ class TestFeatures(unittest.TestCase):
             
         # Allowed internal changes if any? (Not in public API)
 
+    def test_slotted_config(self):
+        class Config(BaseConfigSlotted):
+            NAME: str = "initial"
+            PORT: int = Var(default=8000, min_val=1)
+
+        class SubConfig(Config):
+            DEBUG: bool = False
+
+        os.environ['PORT'] = '9000'
+        try:
+            cfg = SubConfig()
+        finally:
+            del os.environ['PORT']
+
+        self.assertEqual(cfg.NAME, "initial")
+        self.assertEqual(cfg.PORT, 9000)
+        self.assertFalse(cfg.DEBUG)
+        self.assertFalse(hasattr(cfg, '__dict__'))
+        self.assertEqual(cfg.to_dict(), {'NAME': 'initial', 'PORT': 9000, 'DEBUG': False})
+
+        with self.assertRaises(FrozenInstanceError):
+            cfg.PORT = 1
+
+        # Overriding an inherited default without re-annotating it
+        class OverrideConfig(Config):
+            PORT = 8080
+
+        self.assertEqual(OverrideConfig().PORT, 8080)
+        self.assertEqual(Config().PORT, 8000)
+
+    def test_slotted_with_unslotted_bases(self):
+        class Common(BaseConfig):
+            SHARED: int = 1
+
+        class Mixin:
+            MIXED: str = "m"
+
+        class Config(BaseConfigSlotted, Common, Mixin):
+            OWN: int = 2
+
+        with mock.patch.dict(os.environ, {'SHARED': '5'}):
+            cfg = Config()
+        self.assertEqual(cfg.to_dict(), {'MIXED': 'm', 'SHARED': 5, 'OWN': 2})
+
+    def test_config_classes_not_kept_alive(self):
+        from envifrog.cli import _plan_for_docs
+
+        class Temporary(BaseConfig):
+            TEMP_VAR: int = 1
+
+        repr(Temporary())
+        _plan_for_docs(Temporary)
+        ref = weakref.ref(Temporary)
+        del Temporary
+        gc.collect()
+        self.assertIsNone(ref())
+
+    def test_setattr_before_init(self):
+        class Early(BaseConfig):
+            EARLY_VAR: str = "x"
+
+            def __init__(self):
+                self.extra = 5
+                super().__init__()
+
+        cfg = Early()
+        self.assertEqual(cfg.extra, 5)
+
+        class Slotted(BaseConfigSlotted):
+            EARLY_VAR: str = "x"
+
+        clone = copy.copy(Slotted())
+        self.assertEqual(clone.EARLY_VAR, "x")
+        with self.assertRaises(FrozenInstanceError):
+            clone.EARLY_VAR = "y"
+
+    def test_slotted_required_field(self):
+        class Config(BaseConfigSlotted):
+            SLOTTED_REQUIRED: int
+
+        with self.assertRaises(MissingVariableError):
+            Config()
+        self.assertIn("**Required**", Config.generate_markdown_docs())
+
     def test_logging_redaction(self):
         # Create a logger capture
         logger = logging.getLogger("test_redaction")
@@ -40,32 +128,47 @@ class TestFeatures(unittest.TestCase):
         self.assertTrue(any("[REDACTED]" in log for log in cm.output))
         self.assertFalse(any("SECRET_PASSWORD" in log for log in cm.output))
         
+    def test_redaction_overlapping_secrets(self):
+        from envifrog.utils import SecretFilter
+
+        few = ['abc', 'abcdef']
+        many = few + ['s3', 's4', 's5']
+        for secrets in (few, many):
+            f = SecretFilter(secrets)
+            record = logging.LogRecord('test', logging.INFO, '', 0, 'key=abcdef other=abc', (), None)
+            f.filter(record)
+            self.assertEqual(record.msg, 'key=[REDACTED] other=[REDACTED]')
+
+    def test_redaction_in_args(self):
+        from envifrog.utils import SecretFilter
+
+        f = SecretFilter(['hunter2'])
+        record = logging.LogRecord('test', logging.INFO, '', 0, 'login %s with %s', ('bob', 'hunter2'), None)
+        f.filter(record)
+        self.assertEqual(record.getMessage(), 'login bob with [REDACTED]')
+
+        record = logging.LogRecord('test', logging.INFO, '', 0, 'login %s', ('bob',), None)
+        f.filter(record)
+        self.assertEqual((record.msg, record.args), ('login %s', ('bob',)))
+
     def test_profiles_and_merging(self):
-        # Create two files
-        with tempfile.NamedTemporaryFile(mode='w+', delete=False, encoding='utf-8') as f1:
-            f1.write("COMMON=val1\nSPECIFIC_1=one")
-            path1 = f1.name
-            
-        with tempfile.NamedTemporaryFile(mode='w+', delete=False, encoding='utf-8') as f2:
-            f2.write("COMMON=val2\nSPECIFIC_2=two")
-            path2 = f2.name
-            
-        try:
-             class Config(BaseConfig):
-                 COMMON: str
-                 SPECIFIC_1: str
-                 SPECIFIC_2: str
-                 
-             # f2 should override f1
-             cfg = Config(env_path=[path1, path2])
-             
-             self.assertEqual(cfg.COMMON, "val2")
-             self.assertEqual(cfg.SPECIFIC_1, "one")
-             self.assertEqual(cfg.SPECIFIC_2, "two")
-             
-        finally:
-             os.remove(path1)
-             os.remove(path2)
+        with tempfile.TemporaryDirectory() as d:
+            path1 = os.path.join(d, '.env')
+            path2 = os.path.join(d, '.env.local')
+            _atomic_write(path1, "COMMON=val1\nSPECIFIC_1=one")
+            _atomic_write(path2, "COMMON=val2\nSPECIFIC_2=two")
+
+            class Config(BaseConfig):
+                COMMON: str
+                SPECIFIC_1: str
+                SPECIFIC_2: str
+
+            # f2 should override f1
+            cfg = Config(env_path=[path1, path2])
+
+            self.assertEqual(cfg.COMMON, "val2")
+            self.assertEqual(cfg.SPECIFIC_1, "one")
+            self.assertEqual(cfg.SPECIFIC_2, "two")
 
     def test_auto_detection(self):
         os.environ['ENVIFROG_MODE'] = 'testmode'
@@ -85,24 +188,63 @@ class TestFeatures(unittest.TestCase):
             del os.environ['ENVIFROG_MODE']
 
     def test_type_casting_extended(self):
-        os.environ['MY_TUPLE'] = '1,2,3'
-        os.environ['MY_PATH'] = '/tmp/path'
-        os.environ['MY_OPT'] = '100'
-        
         class Config(BaseConfig):
             MY_TUPLE: Tuple[int, ...]
             MY_PATH: Path
             MY_OPT: Optional[int]
-            
-        cfg = Config()
+
+        env = {'MY_TUPLE': '1,2,3', 'MY_PATH': '/tmp/path', 'MY_OPT': '100'}
+        with mock.patch.dict(os.environ, env):
+            cfg = Config()
         self.assertEqual(cfg.MY_TUPLE, (1, 2, 3))
         self.assertIsInstance(cfg.MY_PATH, Path)
         self.assertEqual(str(cfg.MY_PATH).replace('\\', '/'), '/tmp/path')
         self.assertEqual(cfg.MY_OPT, 100)
-        
-        del os.environ['MY_TUPLE']
-        del os.environ['MY_PATH']
-        del os.environ['MY_OPT']
+
+    def test_annotated_hints(self):
+        class Config(BaseConfig):
+            ANNOTATED_PORT: Annotated[int, "port"]
+            ANNOTATED_LIST: List[Annotated[int, "item"]]
+            ANNOTATED_NONE: int = None
+
+        env = {'ANNOTATED_PORT': '7', 'ANNOTATED_LIST': '1,2'}
+        with mock.patch.dict(os.environ, env):
+            cfg = Config()
+        self.assertEqual(Config.__envifrog_hints__, get_type_hints(Config))
+        self.assertEqual(cfg.ANNOTATED_PORT, 7)
+        self.assertEqual(cfg.ANNOTATED_LIST, [1, 2])
+        self.assertIsNone(cfg.ANNOTATED_NONE)
+
+    def test_union_order(self):
+        # Union[int, str] == Union[str, int]: the first member must still win
+        class IntFirst(BaseConfig):
+            UNION_VAL: Union[int, str]
+
+        class StrFirst(BaseConfig):
+            UNION_VAL: Union[str, int]
+
+        class Pep604(BaseConfig):
+            UNION_VAL: int | None
+
+        with mock.patch.dict(os.environ, {'UNION_VAL': 'abc'}):
+            self.assertEqual(StrFirst().UNION_VAL, 'abc')
+        with mock.patch.dict(os.environ, {'UNION_VAL': '7'}):
+            self.assertEqual(IntFirst().UNION_VAL, 7)
+            self.assertEqual(StrFirst().UNION_VAL, '7')
+            self.assertEqual(Pep604().UNION_VAL, 7)
+        with mock.patch.dict(os.environ, {'UNION_VAL': ''}):
+            self.assertIsNone(Pep604().UNION_VAL)
+
+    def test_env_override(self):
+        class Config(BaseConfig):
+            OVERRIDE_PORT: int = 8000
+            OVERRIDE_HOST: str = "localhost"
+
+        with mock.patch.dict(os.environ, {'OVERRIDE_PORT': '9000', 'OVERRIDE_HOST': 'example.com'}):
+            cfg = Config(env_override={'OVERRIDE_PORT': '7000'})
+        self.assertEqual(cfg.OVERRIDE_PORT, 7000)
+        self.assertEqual(cfg.OVERRIDE_HOST, "example.com")
+        self.assertNotIn('OVERRIDE_PORT', os.environ)
 
     def test_docs_generation(self):
         class DocConfig(BaseConfig):
@@ -115,49 +257,233 @@ class TestFeatures(unittest.TestCase):
         self.assertIn("| `int` |", md)
         self.assertIn("| `10` |", md)
         self.assertIn("| Yes |", md)
+        # Built once per class, also available without an instance
+        self.assertIs(DocConfig.generate_markdown_docs(), md)
 
     def test_live_reload(self):
-         # Create a file
+        self._check_live_reload(polling=False)
+
+    def test_live_reload_polling(self):
+        self._check_live_reload(polling=True)
+
+    def test_reload_only_changed_fields(self):
         with tempfile.NamedTemporaryFile(mode='w+', delete=False, encoding='utf-8') as f:
-            f.write("RELOAD_VAR=initial")
+            f.write("STABLE=1\nVOLATILE=1")
             path = f.name
-            
+
+        calls = []
+        hooks = []
+
         try:
+            class ReloadConfig(BaseConfig):
+                STABLE: int = Var(validator=lambda v: calls.append(v) is None)
+                VOLATILE: int
+
+                def hook(self):
+                    hooks.append(self.VOLATILE)
+
+            cfg = ReloadConfig(env_path=path)
+            self.assertEqual(calls, [1])
+
+            with open(path, 'w') as f:
+                f.write("STABLE=1\nVOLATILE=2")
+            cfg._reload(None)
+
+            self.assertEqual(cfg.VOLATILE, 2)
+            self.assertEqual(calls, [1])
+            self.assertEqual(hooks, [1, 2])
+
+            # Same values saved again (and an unused variable added):
+            # no rebuild, no callback
+            reloaded = []
+            with open(path, 'w') as f:
+                f.write("STABLE=1\nVOLATILE=2\nUNUSED=x")
+            cfg._reload(reloaded.append)
+            self.assertEqual(reloaded, [])
+            self.assertEqual(hooks, [1, 2])
+        finally:
+            os.remove(path)
+
+    def test_reload_recovers_after_failure(self):
+        with tempfile.TemporaryDirectory() as d:
+            path = os.path.join(d, '.env')
+            _atomic_write(path, "RECOVER_A=1\nRECOVER_B=1")
+
+            class RecoverConfig(BaseConfig):
+                RECOVER_A: int
+                RECOVER_B: int
+
+            cfg = RecoverConfig(env_path=path)
+
+            # B fails to cast: nothing is applied
+            _atomic_write(path, "RECOVER_A=2\nRECOVER_B=oops")
+            cfg._reload(None)
+            self.assertEqual((cfg.RECOVER_A, cfg.RECOVER_B), (1, 1))
+
+            # Fixed file: A is picked up as well, not only B
+            _atomic_write(path, "RECOVER_A=2\nRECOVER_B=3")
+            cfg._reload(None)
+            self.assertEqual((cfg.RECOVER_A, cfg.RECOVER_B), (2, 3))
+
+    def test_reload_picks_up_environ_changes(self):
+        with tempfile.TemporaryDirectory() as d:
+            path = os.path.join(d, '.env')
+            _atomic_write(path, "FILE_VAR=1")
+
+            class EnvReloadConfig(BaseConfig):
+                FILE_VAR: int
+                ENVIRON_VAR: str
+
+            with mock.patch.dict(os.environ, {'ENVIRON_VAR': 'a'}):
+                cfg = EnvReloadConfig(env_path=path)
+                os.environ['ENVIRON_VAR'] = 'b'
+                _atomic_write(path, "FILE_VAR=2")
+                cfg._reload(None)
+            self.assertEqual((cfg.FILE_VAR, cfg.ENVIRON_VAR), (2, 'b'))
+
+    def test_live_reload_debounces_bursts(self):
+        from envifrog.watcher import has_event_backend
+        if not has_event_backend():
+            self.skipTest("no event-driven watching backend available")
+
+        with tempfile.NamedTemporaryFile(mode='w+', delete=False, encoding='utf-8') as f:
+            f.write("BURST_VAR=0")
+            path = f.name
+
+        try:
+            class BurstConfig(BaseConfig):
+                BURST_VAR: int
+
+            cfg = BurstConfig(env_path=path)
+            calls = []
+            event = threading.Event()
+            def callback(c):
+                calls.append(c.BURST_VAR)
+                event.set()
+
+            ready = cfg.watch(callback, debounce=0.3)
+            self.assertTrue(ready.wait(timeout=1.0))
+
+            for i in range(1, 6):
+                with open(path, 'w') as f:
+                    f.write(f"BURST_VAR={i}")
+
+            event.wait(timeout=5.0)
+            time.sleep(0.5)
+            self.assertEqual(calls, [5])
+
+            cfg._stop_watching.set()
+            cfg._watcher_thread.join()
+        finally:
+            os.remove(path)
+
+    def test_watchdog_reloads_do_not_overlap(self):
+        from envifrog.watcher import AsyncFileWatcher, _watchdog
+        if _watchdog() is None:
+            self.skipTest("watchdog is not installed")
+
+        running = []
+        overlaps = []
+        done = threading.Semaphore(0)
+        def on_change():
+            overlaps.append(bool(running))
+            running.append(1)
+            time.sleep(0.2)
+            running.pop()
+            done.release()
+
+        watcher = AsyncFileWatcher([], on_change, debounce=0.01)
+        watcher.notify()
+        time.sleep(0.1)  # first call in progress
+        watcher.notify()
+        self.assertTrue(done.acquire(timeout=2.0))
+        self.assertTrue(done.acquire(timeout=2.0))
+        self.assertEqual(overlaps, [False, False])
+
+    def test_live_reload_directory_created_later(self):
+        with tempfile.TemporaryDirectory() as d:
+            conf = os.path.join(d, 'conf')
+            path = os.path.join(conf, '.env')
+
+            class LateConfig(BaseConfig):
+                LATE_VAR: str = "default"
+
+            cfg = LateConfig(env_path=path)
+            event = threading.Event()
+            ready = cfg.watch(lambda c: event.set())
+            self.assertTrue(ready.wait(timeout=1.0))
+
+            # Not watchable with events yet: picked up by polling instead
+            os.mkdir(conf)
+            _atomic_write(path, "LATE_VAR=created")
+            event.wait(timeout=5.0)
+            self.assertEqual(cfg.LATE_VAR, "created")
+
+            cfg._stop_watching.set()
+            cfg._watcher_thread.join()
+
+    def test_watch_restart_right_after_stop(self):
+        with tempfile.TemporaryDirectory() as d:
+            path = os.path.join(d, '.env')
+            _atomic_write(path, "RESTART_VAR=1")
+
+            class RestartConfig(BaseConfig):
+                RESTART_VAR: int
+
+            cfg = RestartConfig(env_path=path)
+            event = threading.Event()
+            self.assertTrue(cfg.watch(lambda c: None).wait(timeout=1.0))
+
+            cfg._stop_watching.set()
+            ready = cfg.watch(lambda c: event.set())
+            self.assertTrue(ready.wait(timeout=1.0))
+            self.assertTrue(cfg._watcher_thread.is_alive())
+
+            _atomic_write(path, "RESTART_VAR=2")
+            event.wait(timeout=5.0)
+            self.assertEqual(cfg.RESTART_VAR, 2)
+
+            cfg._stop_watching.set()
+            cfg._watcher_thread.join()
+
+    def _check_live_reload(self, polling):
+        with tempfile.TemporaryDirectory() as d:
+            path = os.path.join(d, '.env')
+            _atomic_write(path, "RELOAD_VAR=initial")
+
             class ReloadConfig(BaseConfig):
                 RELOAD_VAR: str
-                
+
             cfg = ReloadConfig(env_path=path)
             self.assertEqual(cfg.RELOAD_VAR, "initial")
-            
+
             event = threading.Event()
             def callback(c):
                 event.set()
-                
-            cfg.watch(callback)
-            
-            # Wait a bit to ensure watcher started
-            time.sleep(1.1)
-            
-            # Modify file
-            # Update mtime significantly
-            with open(path, 'w') as f:
-                f.write("RELOAD_VAR=changed")
-            
-            # Windows filesystem time resolution can be coarse?
-            # sleep
-            
+
+            ready = cfg.watch(callback, polling=polling)
+            self.assertTrue(ready.wait(timeout=1.0))
+
+            # Replace the file the way editors do: one rename, never a
+            # half-written file
+            _atomic_write(path, "RELOAD_VAR=changed")
+
             # Wait for callback
             event.wait(timeout=5.0)
-            
+
             self.assertEqual(cfg.RELOAD_VAR, "changed")
-            
+
             # Stop watcher
             cfg._stop_watching.set()
             if cfg._watcher_thread:
                 cfg._watcher_thread.join()
-                
-        finally:
-            os.remove(path)
+
+
+def _atomic_write(path, data):
+    tmp = path + '.tmp'
+    with open(tmp, 'w', encoding='utf-8') as f:
+        f.write(data)
+    os.replace(tmp, path)
 
 if __name__ == '__main__':
     unittest.main()